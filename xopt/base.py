@@ -468,7 +468,8 @@ class Xopt(XoptBaseModel):
         n_samples : int, optional
             The number of random samples to generate.
         seed : int, optional
-            The random seed for reproducibility.
+            The random seed for reproducibility. If None, sampling is
+            nondeterministic and independent of the global numpy RNG state.
         custom_bounds : dict, optional
             Dictionary of vocs-like ranges for random sampling
 
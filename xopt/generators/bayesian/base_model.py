@@ -5,6 +5,7 @@ import warnings
 import pandas as pd
 import torch
 from botorch import fit_gpytorch_mll
+from botorch.fit import fit_gpytorch_mll_torch
 from botorch.models import ModelListGP, SingleTaskGP
 from botorch.models.model import Model
 from gpytorch import ExactMarginalLogLikelihood
@@ -122,6 +123,28 @@ class ModelConstructor(XoptBaseModel, ABC):
             vocs.variable_names, vocs.output_names, data, vocs.variables, dtype, device
         )
 
+    @staticmethod
+    def _fit_mll(mll: ExactMarginalLogLikelihood) -> None:
+        """
+        Fit a marginal log likelihood, keeping the optimization on-device.
+
+        The default scipy-based fit round-trips parameters through numpy on
+        the host every iteration; when the training data lives on a GPU the
+        torch-based optimizer avoids that host/device ping-pong. On CUDA the
+        fit also allows TF32 tensor-core matmuls, which only affects models
+        trained in single precision -- the default double-precision path is
+        left untouched since the Cholesky factorizations rely on it.
+        """
+        if mll.model.train_inputs[0].is_cuda:
+            allow_tf32 = torch.backends.cuda.matmul.allow_tf32
+            torch.backends.cuda.matmul.allow_tf32 = True
+            try:
+                fit_gpytorch_mll_torch(mll)
+            finally:
+                torch.backends.cuda.matmul.allow_tf32 = allow_tf32
+        else:
+            fit_gpytorch_mll(mll)
+
     @staticmethod
     def build_single_task_gp(X: Tensor, Y: Tensor, train=True, **kwargs) -> Model:
         """
@@ -150,7 +173,7 @@ class ModelConstructor(XoptBaseModel, ABC):
 
         if train:
             mll = ExactMarginalLogLikelihood(model.likelihood, model)
-            fit_gpytorch_mll(mll)
+            ModelConstructor._fit_mll(mll)
         return model
 
     @staticmethod
@@ -198,5 +221,5 @@ class ModelConstructor(XoptBaseModel, ABC):
         model = XoptHeteroskedasticSingleTaskGP(X, Y, Yvar, **kwargs)
         if train:
             mll = ExactMarginalLogLikelihood(model.likelihood, model)
-            fit_gpytorch_mll(mll)
+            ModelConstructor._fit_mll(mll)
         return model
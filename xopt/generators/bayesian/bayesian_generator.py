@@ -4,7 +4,7 @@ import time
 import warnings
 from abc import ABC, abstractmethod
 from copy import deepcopy
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import Any, Callable, Dict, List, Optional, Union, cast
 
 import numpy as np
 import pandas as pd
@@ -17,6 +17,7 @@ from botorch.acquisition import (
 )
 from botorch.models.model import Model
 from botorch.sampling import get_sampler
+from botorch.utils.multi_objective import Hypervolume
 from gpytorch import Module
 from pydantic import (
     Field,
@@ -54,7 +55,6 @@ from xopt.generators.bayesian.utils import (
     validate_turbo_controller_base,
     compute_hypervolume_and_pf,
 )
-from xopt.generators.bayesian.visualize import visualize_generator_model
 from xopt.numerical_optimizer import GridOptimizer, LBFGSOptimizer, NumericalOptimizer
 from xopt.pydantic import decode_torch_module
 from xopt.vocs import VOCS
@@ -173,6 +173,7 @@ class BayesianGenerator(Generator, ABC):
 
     n_candidates: int = 1
 
+    _constraint_callables: Optional[list[Callable]] = PrivateAttr(default=None)
     _compatible_turbo_controllers: Optional[list[type[TurboController]]] = PrivateAttr(
         default=None
     )
@@ -609,9 +610,21 @@ class BayesianGenerator(Generator, ABC):
         input names (variables), and the resulting tensor is configured with the data
         type and device settings from the generator.
         """
-        return torch.tensor(
-            data[self.model_input_names].to_numpy().copy(), **self.tkwargs
-        )
+        # to_numpy(copy=True) already produces a fresh array, so the tensor can
+        # share its memory instead of copying it a second time
+        array = data[self.model_input_names].to_numpy(dtype="double", copy=True)
+        return self._to_device(torch.from_numpy(array).to(self.tkwargs["dtype"]))
+
+    def _to_device(self, tensor: torch.Tensor) -> torch.Tensor:
+        """
+        Move a host tensor to the generator device. When the target is a GPU
+        the tensor is staged through pinned host memory so the copy is
+        asynchronous with respect to the host.
+        """
+        device = self.tkwargs["device"]
+        if device == "cpu":
+            return tensor
+        return tensor.pin_memory().to(device, non_blocking=True)
 
     def get_acquisition(self, model: Module) -> AcquisitionFunction:
         """
@@ -736,6 +749,9 @@ class BayesianGenerator(Generator, ABC):
         result : tuple
             The matplotlib figure and axes objects.
         """
+        # lazy import keeps matplotlib out of the optimization hot path
+        from xopt.generators.bayesian.visualize import visualize_generator_model
+
         return visualize_generator_model(self, **kwargs)
 
     def _get_initial_conditions(self, n_candidates=1) -> Union[Tensor, None]:
@@ -795,11 +811,14 @@ class BayesianGenerator(Generator, ABC):
         return objective.to(**self.tkwargs)
 
     def _get_constraint_callables(self):
-        """return constraint callable determined by vocs"""
-        constraint_callables = create_constraint_callables(self.vocs)
-        if len(constraint_callables) == 0:
-            constraint_callables = None
-        return constraint_callables
+        """return constraint callables determined by vocs, built once and
+        reused across acquisition function constructions"""
+        if self._constraint_callables is None:
+            constraint_callables = create_constraint_callables(self.vocs)
+            if len(constraint_callables) == 0:
+                constraint_callables = None
+            self._constraint_callables = constraint_callables
+        return self._constraint_callables
 
     def _apply_fixed_features(self, acq):
         """apply fixed features to the acquisition function if needed"""
@@ -1084,22 +1103,37 @@ class MultiObjectiveBayesianGenerator(BayesianGenerator, ABC):
         if self.pareto_front_history is None:
             self.pareto_front_history = pd.DataFrame()
 
+        # the reference point and hypervolume calculator do not change while
+        # iterating, build them once
+        reference_point = self.torch_reference_point
+        hv_calculator = Hypervolume(reference_point)
+
+        # scaling and validity checks are applied row-by-row, so the data only
+        # needs to be extracted and scaled once -- prefixes of the scaled
+        # tensors correspond to prefixes of the data
+        variable_data, objective_data, _ = self._get_scaled_data(data=self.data)
+        valid_index = self.vocs.extract_data(
+            self.data, return_raw=True, return_valid=True
+        )[0].index
+
         # for each row of data, compute the cumulative pareto front stats
+        new_rows: list[pd.DataFrame] = []
+        n_valid = 0
         for i in self.data.index:
+            # track the number of valid rows up to and including row i
+            if n_valid < len(valid_index) and valid_index[n_valid] == i:
+                n_valid += 1
+
             # check if the pareto front stats already exist
             if i in self.pareto_front_history.index:
                 continue
 
-            # get scaled data
-            variable_data, objective_data, _ = self._get_scaled_data(
-                data=self.data.loc[:i]
-            )
-
             # compute the pareto front stats
             _, pareto_front_variables, _, hv = compute_hypervolume_and_pf(
-                variable_data,
-                objective_data,
-                self.torch_reference_point,
+                variable_data[:n_valid],
+                objective_data[:n_valid],
+                reference_point,
+                hv=hv_calculator,
             )
 
             # get the number of non-dominated points
@@ -1113,12 +1147,12 @@ class MultiObjectiveBayesianGenerator(BayesianGenerator, ABC):
                 "hypervolume": hv,
                 "n_non_dominated": n_non_dominated,
             }
-            # add the new row to the pareto front history
+            new_rows.append(pd.DataFrame(new_row, index=[i]))
+
+        # add the new rows to the pareto front history in a single concat
+        if new_rows:
             self.pareto_front_history = pd.concat(
-                [
-                    self.pareto_front_history,
-                    pd.DataFrame(new_row, index=[i]),
-                ],
+                [self.pareto_front_history, *new_rows],
                 ignore_index=False,
             )
 
@@ -1131,8 +1165,12 @@ class MultiObjectiveBayesianGenerator(BayesianGenerator, ABC):
             data, return_raw=True, return_valid=True
         )
 
-        variable_data = torch.tensor(var_df[self.vocs.variable_names].to_numpy())
-        objective_data = torch.tensor(obj_df[self.vocs.objective_names].to_numpy())
+        variable_data = torch.from_numpy(
+            var_df[self.vocs.variable_names].to_numpy(dtype="double", copy=True)
+        )
+        objective_data = torch.from_numpy(
+            obj_df[self.vocs.objective_names].to_numpy(dtype="double", copy=True)
+        )
         weights = set_botorch_weights(self.vocs)[: self.vocs.n_objectives]
         return variable_data, objective_data * weights, weights
 
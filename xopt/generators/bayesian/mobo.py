@@ -51,10 +51,16 @@ class MOBOGenerator(MultiObjectiveBayesianGenerator):
         description="flag to specify if pareto front points are to be used during "
         "optimization of the acquisition function",
     )
+    use_last_candidates_as_initial_points: bool = Field(
+        False,
+        description="flag to specify if the candidates from the previous generate "
+        "call are used to warm start optimization of the acquisition function",
+    )
     __doc__ = """Implements Multi-Objective Bayesian Optimization using the Log Expected
             Hypervolume Improvement acquisition function"""
 
     _compatible_turbo_controllers = [SafetyTurboController]
+    _last_candidates: Optional[Tensor] = None
 
     def _get_objective(self) -> MCMultiOutputObjective:
         """
@@ -133,16 +139,45 @@ class MOBOGenerator(MultiObjectiveBayesianGenerator):
         )
         return acq
 
+    def propose_candidates(self, model: torch.nn.Module, n_candidates: int = 1):
+        """
+        Propose candidates using Bayesian Optimization.
+
+        Keeps a copy of the optimized candidates so the next acquisition
+        function optimization can be warm started from them (see
+        `use_last_candidates_as_initial_points`).
+
+        Parameters
+        ----------
+        model : torch.nn.Module
+            The trained Bayesian model.
+        n_candidates : int, optional
+            The number of candidates to propose, by default 1.
+
+        Returns
+        -------
+        Tensor
+            A tensor containing the proposed candidates.
+        """
+        candidates = super().propose_candidates(model, n_candidates)
+        self._last_candidates = candidates.detach().clone()
+        return candidates
+
     def _get_initial_conditions(self, n_candidates: int = 1) -> Optional[Tensor]:
         """
         Generate initial candidates for optimizing the acquisition function based on
-        the Pareto front.
+        the Pareto front and/or the candidates from the previous generate call.
 
         If `use_pf_as_initial_points` flag is set to true then the current
         Pareto-optimal set is used as initial points for optimizing the acquisition
         function instead of randomly selected points (random points fill in the set
         if `num_restarts` is greater than the number of points in the Pareto set).
 
+        If `use_last_candidates_as_initial_points` flag is set to true then the
+        candidates proposed at the previous step are added as an additional
+        restart, which warm starts the optimizer since the acquisition landscape
+        shifts only slightly between steps.
+
         Parameters
         ----------
         n_candidates : int, optional
@@ -151,47 +186,66 @@ class MOBOGenerator(MultiObjectiveBayesianGenerator):
         Returns
         -------
         Optional[Tensor]
-            A `num_restarts x q x d` tensor of initial conditions, or None if the
-            Pareto front is not used.
+            A `num_restarts x q x d` tensor of initial conditions, or None if no
+            warm start points are used or available.
         """
+        if not (
+            self.use_pf_as_initial_points
+            or self.use_last_candidates_as_initial_points
+        ):
+            return None
+
+        if not isinstance(self.numerical_optimizer, LBFGSOptimizer):
+            raise RuntimeWarning(
+                "cannot use PF as initial optimization points "
+                "for non-LBFGS optimizers, ignoring flag"
+            )
+
+        bounds = self._get_optimization_bounds()
+        num_restarts = self.numerical_optimizer.n_restarts
+
+        initial_points = None
         if self.use_pf_as_initial_points:
-            if isinstance(self.numerical_optimizer, LBFGSOptimizer):
-                bounds = self._get_optimization_bounds()
-                num_restarts = self.numerical_optimizer.n_restarts
-
-                pf_locations, _, _, _ = self.get_pareto_front_and_hypervolume()
-
-                # if there is no pareto front just return None to revert back to
-                # default behavior
-                if pf_locations is None:
-                    return None
+            pf_locations, _, _, _ = self.get_pareto_front_and_hypervolume()
 
+            if pf_locations is not None:
                 initial_points = torch.clone(pf_locations)
 
                 # add the q dimension
                 initial_points = initial_points.unsqueeze(1)
                 initial_points = initial_points.expand([-1, n_candidates, -1])
 
-                # initial_points must equal the number of restarts
-                if len(initial_points) < num_restarts:
-                    # add random points to the list inside the bounds
-                    sobol_samples = draw_sobol_samples(
-                        bounds, num_restarts - len(initial_points), n_candidates
-                    )
-
-                    initial_points = torch.cat([initial_points, sobol_samples])
-                elif len(initial_points) > num_restarts:
-                    # if there are too many select the first `num_restarts` points at
-                    # random
-                    initial_points = initial_points[
-                        torch.randperm(len(initial_points))
-                    ][:num_restarts]
-
-                return initial_points
-            else:
-                raise RuntimeWarning(
-                    "cannot use PF as initial optimization points "
-                    "for non-LBFGS optimizers, ignoring flag"
-                )
-
-        return None
+        # add the previous step's optimized candidates as an additional restart
+        if (
+            self.use_last_candidates_as_initial_points
+            and self._last_candidates is not None
+        ):
+            last_candidates = self._last_candidates.to(bounds)
+            if last_candidates.shape == (n_candidates, bounds.shape[-1]):
+                last_candidates = last_candidates.unsqueeze(0)
+                if initial_points is None:
+                    initial_points = last_candidates
+                else:
+                    initial_points = torch.cat([initial_points, last_candidates])
+
+        # if there are no warm start points just return None to revert back to
+        # default behavior
+        if initial_points is None:
+            return None
+
+        # initial_points must equal the number of restarts
+        if len(initial_points) < num_restarts:
+            # add random points to the list inside the bounds
+            sobol_samples = draw_sobol_samples(
+                bounds, num_restarts - len(initial_points), n_candidates
+            )
+
+            initial_points = torch.cat([initial_points, sobol_samples])
+        elif len(initial_points) > num_restarts:
+            # if there are too many select the first `num_restarts` points at
+            # random
+            initial_points = initial_points[torch.randperm(len(initial_points))][
+                :num_restarts
+            ]
+
+        return initial_points
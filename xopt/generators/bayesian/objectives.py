@@ -117,9 +117,10 @@ def create_constraint_callables(vocs: VOCS) -> Optional[List[Callable]]:
         constraint_names = vocs.constraint_names
         constraint_callables = []
         output_names = vocs.output_names
+        output_index = {name: i for i, name in enumerate(output_names)}
         for name in constraint_names:
             constraint = vocs.constraints[name]
-            index = output_names.index(name)
+            index = output_index[name]
             value = constraint[1]
             sign = 1 if constraint[0] == "LESS_THAN" else -1
 
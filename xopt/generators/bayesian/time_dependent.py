@@ -149,8 +149,10 @@ class TimeDependentBayesianGenerator(BayesianGenerator, ABC):
                 "added time for accurate results",
                 RuntimeWarning,
             )
-        while time.time() < self.target_prediction_time:
-            time.sleep(0.001)
+        # sleep once for the remaining duration instead of polling every 1 ms
+        remaining_time = self.target_prediction_time - time.time()
+        if remaining_time > 0:
+            time.sleep(remaining_time)
 
         return output
 
@@ -175,9 +177,12 @@ class TimeDependentBayesianGenerator(BayesianGenerator, ABC):
         input names (variables), and the resulting tensor is configured with the data
         type and device settings from the generator.
         """
-        return torch.tensor(
-            data[self.model_input_names + ["time"]].to_numpy(), **self.tkwargs
+        # to_numpy(copy=True) already produces a fresh array, so the tensor can
+        # share its memory instead of copying it a second time
+        array = data[self.model_input_names + ["time"]].to_numpy(
+            dtype="double", copy=True
         )
+        return self._to_device(torch.from_numpy(array).to(self.tkwargs["dtype"]))
 
     def get_acquisition(
         self, model: torch.nn.Module
@@ -421,10 +421,10 @@ class OptimizeTurboController(TurboController):
         else:
             self._set_best_point_value(data[feas_data["feasible"]])
 
-        # get feasibility of last `n_candidates`
+        # get feasibility of last `n_candidates`, reusing the mask computed on
+        # the full dataset above
         recent_data = data.iloc[-previous_batch_size:]
-        f_data = self.vocs.feasibility_data(recent_data)
-        recent_f_data = recent_data[f_data["feasible"]]
+        recent_f_data = recent_data[feas_data["feasible"].iloc[-previous_batch_size:]]
         recent_f_data_minform = self.vocs.objective_data(recent_f_data, "")
 
         # if none of the candidates are valid count this as a failure
@@ -513,12 +513,15 @@ class SafetyTurboController(TurboController):
         """
         data = generator.data
 
+        # compute the feasibility mask once for both uses below
+        feas_data = self.vocs.feasibility_data(data)
+
         # set center point to be mean of valid data points
-        feas = data[self.vocs.feasibility_data(data)["feasible"]]
+        feas = data[feas_data["feasible"]]
         self.center_x = feas[self.vocs.variable_names].mean().to_dict()
 
         # get the feasibility fractions of the last batch
-        last_batch = self.vocs.feasibility_data(data).iloc[-previous_batch_size:]
+        last_batch = feas_data.iloc[-previous_batch_size:]
         feas_fraction = last_batch["feasible"].sum() / len(last_batch)
 
         if feas_fraction > self.min_feasible_fraction:
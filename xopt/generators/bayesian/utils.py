@@ -1,6 +1,6 @@
 from contextlib import nullcontext
 from copy import deepcopy
-from typing import Any, List, cast
+from typing import Any, List, Optional, cast
 
 import gpytorch
 import numpy as np
@@ -54,23 +54,22 @@ def get_training_data(
     input_data = data[input_names]
     outcome_data = data[outcome_name]
 
-    # cannot use any rows where any variable values are nans
-    non_nans = ~input_data.isnull().T.any()
-    input_data = input_data[non_nans]
-    outcome_data = outcome_data[non_nans]
+    # cannot use any rows where any variable or outcome values are nans --
+    # build the row mask once and index each frame a single time
+    valid_rows = ~(input_data.isnull().any(axis=1) | outcome_data.isnull())
 
-    train_X = torch.tensor(
-        input_data[~outcome_data.isnull()].to_numpy(dtype="double").copy()
+    # wrap the freshly allocated numpy arrays instead of copying them again
+    train_X = torch.from_numpy(
+        input_data[valid_rows].to_numpy(dtype="double", copy=True)
     )
-    train_Y = torch.tensor(
-        outcome_data[~outcome_data.isnull()].to_numpy(dtype="double").copy()
+    train_Y = torch.from_numpy(
+        outcome_data[valid_rows].to_numpy(dtype="double", copy=True)
     ).unsqueeze(-1)
 
     train_Yvar = None
     if f"{outcome_name}_var" in data:
-        variance_data = data[f"{outcome_name}_var"][non_nans]
-        train_Yvar = torch.tensor(
-            variance_data[~outcome_data.isnull()].to_numpy(dtype="double").copy()
+        train_Yvar = torch.from_numpy(
+            data[f"{outcome_name}_var"][valid_rows].to_numpy(dtype="double", copy=True)
         ).unsqueeze(-1)
 
     return train_X, train_Y, train_Yvar
@@ -79,6 +78,7 @@ def get_training_data(
 def set_botorch_weights(vocs: VOCS):
     """set weights to multiply xopt objectives or observables for botorch objectives"""
     output_names = vocs.output_names
+    output_index = {name: i for i, name in enumerate(output_names)}
 
     weights = torch.zeros(len(output_names), dtype=torch.double)
 
@@ -88,14 +88,14 @@ def set_botorch_weights(vocs: VOCS):
         # ordering of output names
         for objective_name in vocs.objective_names:
             if vocs.objectives[objective_name] == "MINIMIZE":
-                weights[output_names.index(objective_name)] = -1.0
+                weights[output_index[objective_name]] = -1.0
             elif vocs.objectives[objective_name] == "MAXIMIZE":
-                weights[output_names.index(objective_name)] = 1.0
+                weights[output_index[objective_name]] = 1.0
     if vocs.n_objectives == 0:
         # if no objectives exist this may be an exploration problem, weight each
         # observable by 1.0
         for observable_name in vocs.observables:
-            weights[output_names.index(observable_name)] = 1.0
+            weights[output_index[observable_name]] = 1.0
 
     return weights
 
@@ -488,6 +488,7 @@ def compute_hypervolume_and_pf(
     X: torch.Tensor,
     Y: torch.Tensor,
     reference_point: torch.Tensor,
+    hv: Optional[Hypervolume] = None,
 ) -> tuple[torch.Tensor | None, torch.Tensor | None, torch.Tensor | None, float]:
     """
     Compute the hypervolume and pareto front
@@ -501,6 +502,9 @@ def compute_hypervolume_and_pf(
         The objective values of the points.
     reference_point : torch.Tensor
         The reference point for hypervolume calculation.
+    hv : Optional[Hypervolume]
+        A prebuilt hypervolume calculator for `reference_point`; callers
+        invoking this function in a loop can construct it once and pass it in.
 
     Returns
     -------
@@ -515,10 +519,12 @@ def compute_hypervolume_and_pf(
         The hypervolume value.
     """
 
-    hv = Hypervolume(reference_point)
     if Y.shape[0] == 0:
         return None, None, None, 0.0
 
+    if hv is None:
+        hv = Hypervolume(reference_point)
+
     # add the reference point to the objective values
     # add a dummy point to the X values
     X = torch.vstack((torch.zeros(1, X.shape[1], dtype=X.dtype), X))
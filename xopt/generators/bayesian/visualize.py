@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from typing import (
     Any,
     Generic,
@@ -5,6 +7,7 @@ from typing import (
     List,
     Dict,
     Tuple,
+    TYPE_CHECKING,
     TypeVar,
     TypedDict,
     Union,
@@ -17,9 +20,9 @@ from botorch.acquisition import AcquisitionFunction
 from botorch.models import ModelListGP
 from pandas import DataFrame
 
-from matplotlib.figure import Figure
-from matplotlib.axes import Axes
-from matplotlib.ticker import FormatStrFormatter
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+    from matplotlib.axes import Axes
 
 from xopt.generator import Generator
 from xopt.vocs import VOCS
@@ -85,9 +88,6 @@ def visualize_generator_model(
 
     """
 
-    # append docstring dynamically
-    visualize_generator_model.__doc__ += visualize_model.__doc__
-
     if generator.model is None:
         raise ValueError(
             "The generator.model doesn't exist, try calling generator.train_model()."
@@ -382,6 +382,10 @@ def visualize_model(
     return fig, ax
 
 
+# append the inherited docstring once at import time rather than on every call
+visualize_generator_model.__doc__ += visualize_model.__doc__
+
+
 def plot_model_prediction(
     model: ModelListGP,
     vocs: VOCS,
@@ -1004,6 +1008,8 @@ def _plot2d_prediction(
     axis.set_xlabel(variable_names[0])
     axis.set_ylabel(variable_names[1])
 
+    from matplotlib.ticker import FormatStrFormatter  # lazy import
+
     cbar.ax.ticklabel_format(axis="both", style="sci", useOffset=False)
     cbar.ax.yaxis.set_major_formatter(FormatStrFormatter("%.3f"))
 
@@ -39,8 +39,9 @@ class CNSGAGenerator(Generator):
         The directory path to save the population files.
     _children : List[Dict]
         The list of children generated.
-    _offspring : Optional[pd.DataFrame]
-        The DataFrame containing the offspring.
+    _offspring_chunks : List[pd.DataFrame]
+        Evaluated offspring accumulated for the current generation, stored as
+        chunks and concatenated once per generation.
     population : Optional[pd.DataFrame]
         The DataFrame containing the population.
 
@@ -80,7 +81,8 @@ class CNSGAGenerator(Generator):
         None, description="Output path for population files"
     )
     _children: List[Dict] = PrivateAttr([])
-    _offspring: Optional[pd.DataFrame] = PrivateAttr(None)
+    _offspring_chunks: List[pd.DataFrame] = PrivateAttr([])
+    _n_offspring: int = PrivateAttr(0)
     population: Optional[pd.DataFrame] = Field(None)
 
     model_config = ConfigDict(extra="allow")
@@ -140,11 +142,14 @@ class CNSGAGenerator(Generator):
             The new data to be added.
         """
         if new_data is not None:
-            self._offspring = pd.concat([self._offspring, new_data])
+            # buffer offspring chunks and concatenate once per generation to
+            # avoid copying the accumulated offspring on every call
+            self._offspring_chunks.append(new_data)
+            self._n_offspring += len(new_data)
 
             # Next generation
-            if len(self._offspring) >= self.n_pop:
-                candidates = pd.concat([self.population, self._offspring])
+            if self._n_offspring >= self.n_pop:
+                candidates = pd.concat([self.population, *self._offspring_chunks])
                 self.population = cnsga_select(
                     candidates, self.n_pop, self.vocs, self._toolbox
                 )
@@ -154,7 +159,8 @@ class CNSGAGenerator(Generator):
                     self.write_population()
 
                 self._children = []  # reset children
-                self._offspring = None  # reset offspring
+                self._offspring_chunks = []  # reset offspring
+                self._n_offspring = 0
 
     def generate(self, n_candidates: int) -> List[Dict]:
         """
@@ -185,7 +191,7 @@ class CNSGAGenerator(Generator):
         filename : str, optional
             The file path to save the offspring. If None, a timestamped filename is generated.
         """
-        if self._offspring is None:
+        if not self._offspring_chunks:
             logger.warning("No offspring to write")
             return
 
@@ -194,7 +200,8 @@ class CNSGAGenerator(Generator):
             filename = f"{self.name}_offspring_{timestamp}.csv"
             filename = os.path.join(self.output_path, filename)
 
-        self._offspring.to_csv(filename, index_label="xopt_index")
+        offspring = pd.concat(self._offspring_chunks)
+        offspring.to_csv(filename, index_label="xopt_index")
 
     def write_population(self, filename: Optional[str] = None):
         """
@@ -39,7 +39,9 @@ class SimplexState(XoptBaseModel):
         "ind", "fsim", "sim", "x", "xr", "xe", "xc", "xcc", "xbar", mode="before"
     )
     def to_numpy(cls, v):
-        return np.array(v, dtype=np.float64)
+        # asarray avoids copying arrays that are already float64, which
+        # matters since a state object is built after every evaluation
+        return np.asarray(v, dtype=np.float64)
 
 
 STATE_KEYS = [
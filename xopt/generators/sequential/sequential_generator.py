@@ -1,3 +1,4 @@
+import operator
 from typing import Dict, List, Optional, Tuple
 import numpy as np
 
@@ -17,8 +18,69 @@ class SequentialGenerator(Generator, StateOwner):
 
     is_active: bool = False
     _last_candidate: Optional[List[Dict[str, float]]] = None
+    _last_candidate_arr: Optional[np.ndarray] = None
+    _var_names_tuple: Optional[Tuple[str, ...]] = None
     _data_set: bool = False
 
+    # cached integer column indexers for reading points off the raw ndarray
+    _cached_columns: Optional[pd.Index] = None
+    _var_col_idx: Optional[np.ndarray] = None
+    _obj_col_idx: Optional[np.ndarray] = None
+
+    # history is buffered as a list of chunks and only concatenated when the
+    # merged frame is actually read, keeping the append path O(1) per step
+    _data_chunks: List[pd.DataFrame] = []
+    _data_cache: Optional[pd.DataFrame] = None
+
+    def model_post_init(self, context) -> None:
+        super().model_post_init(context)
+        # move any data passed at construction into the chunk buffer; the
+        # `data` field itself stays None and all access goes through
+        # __getattribute__/__setattr__ below
+        initial_data = self.__dict__.get("data")
+        if initial_data is not None:
+            self._data_chunks = [initial_data]
+            self._data_cache = initial_data
+            self.__dict__["data"] = None
+
+    def __getattribute__(self, name: str):
+        # route reads of `data` through the lazy materializer, reads of any
+        # other attribute are unaffected
+        if name == "data":
+            return object.__getattribute__(self, "_get_data")()
+        return super().__getattribute__(name)
+
+    def __setattr__(self, name: str, value):
+        # route writes of `data` into the chunk buffer
+        if name == "data":
+            self._set_data_attr(value)
+        else:
+            super().__setattr__(name, value)
+
+    def _get_data(self) -> Optional[pd.DataFrame]:
+        """
+        Lazily materialize the full dataset from the chunk buffer.
+
+        Returns
+        -------
+        pd.DataFrame or None
+            The merged data, or None if no data has been added.
+        """
+        if self._data_cache is None and self._data_chunks:
+            if len(self._data_chunks) == 1:
+                self._data_cache = self._data_chunks[0]
+            else:
+                self._data_cache = pd.concat(self._data_chunks, axis=0)
+                # collapse the buffer so repeated reads do not re-concatenate
+                self._data_chunks = [self._data_cache]
+        return self._data_cache
+
+    def _set_data_attr(self, value: Optional[pd.DataFrame]):
+        if isinstance(value, dict):
+            value = pd.DataFrame(value)
+        self._data_cache = value
+        self._data_chunks = [] if value is None else [value]
+
     def add_data(self, new_data: pd.DataFrame):
         """
         Add new data to the generator.
@@ -48,23 +110,49 @@ class SequentialGenerator(Generator, StateOwner):
                 self.validate_point(self._last_candidate[0])
 
         # do not call super, this will likely need to be customized for some generators
-        if self.data is not None:
-            self.data = pd.concat([self.data, new_data], axis=0)
-        else:
-            self.data = new_data
+        # append a chunk instead of concatenating the full history each step
+        self._data_chunks.append(new_data)
+        self._data_cache = None
 
         # update internal state of the generator
         self._add_data(new_data)
 
+    def _get_col_indexers(self, columns: pd.Index) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Integer column positions of the variable and objective columns,
+        recomputed only when the column layout changes.
+        """
+        if self._cached_columns is None or not columns.equals(self._cached_columns):
+            self._var_col_idx = np.array(
+                [columns.get_loc(name) for name in self._var_names]
+            )
+            self._obj_col_idx = np.array(
+                [columns.get_loc(name) for name in self.vocs.objective_names]
+            )
+            self._cached_columns = columns
+        return self._var_col_idx, self._obj_col_idx
+
+    @property
+    def _var_names(self) -> Tuple[str, ...]:
+        """column-ordered variable names, cached to avoid rebuilding the list"""
+        if self._var_names_tuple is None:
+            self._var_names_tuple = tuple(self.vocs.variable_names)
+        return self._var_names_tuple
+
     def validate_point(self, point: Dict[str, float]):
         """determine if a point was generated by the generator"""
-        last_candidate = np.array(
-            [self._last_candidate[0][ele] for ele in self.vocs.variable_names]
-        )
-        point_variables = np.array(
-            [point[ele] for ele in self.vocs.variable_names]
+        names = self._var_names
+        if self._last_candidate_arr is None:
+            self._last_candidate_arr = np.asarray(
+                operator.itemgetter(*names)(self._last_candidate[0]),
+                dtype=np.float64,
+            ).flatten()
+        point_variables = np.asarray(
+            operator.itemgetter(*names)(point), dtype=np.float64
         ).flatten()
-        if not np.allclose(last_candidate, point_variables, atol=0.0, rtol=1e-6):
+        if not np.allclose(
+            self._last_candidate_arr, point_variables, atol=0.0, rtol=1e-6
+        ):
             raise SeqGeneratorError(
                 "Cannot add data that was not generated by the generator when generator is active. "
                 "Call reset() to reset the generator first in order to add data via other methods."
@@ -141,8 +229,10 @@ class SequentialGenerator(Generator, StateOwner):
         else:
             candidate = self._generate()
 
-        # need to store the candidate to validate adding data to the generator
+        # need to store the candidate to validate adding data to the generator,
+        # the array form is built lazily on first validation
         self._last_candidate = candidate
+        self._last_candidate_arr = None
 
         return candidate
 
@@ -170,6 +260,7 @@ class SequentialGenerator(Generator, StateOwner):
         """
         self.is_active = False
         self._last_candidate = None
+        self._last_candidate_arr = None
         self._reset()
 
     def _reset(self):
@@ -199,11 +290,15 @@ class SequentialGenerator(Generator, StateOwner):
         ValueError
             If there are no points in the data.
         """
-        # get the initial x0 value from data
-        if self.data is None or len(self.data) == 0:
-            raise ValueError(
-                f"At least one point is required to start {self.__class__.__name__}, add data manually or via Xopt.random_evaluate() or Xopt.evaluate_data()"
-            )
-        x0 = self.data.iloc[-1][self.vocs.variable_names].to_numpy(dtype=float)
-        f0 = self.data.iloc[-1][self.vocs.objective_names].to_numpy(dtype=float)
-        return x0, f0
+        # get the initial x0 value from the last non-empty chunk, avoiding a
+        # concat of the full history
+        for chunk in reversed(self._data_chunks):
+            if len(chunk):
+                var_idx, obj_idx = self._get_col_indexers(chunk.columns)
+                last_row = chunk.values[-1]
+                x0 = last_row[var_idx].astype(np.float64)
+                f0 = last_row[obj_idx].astype(np.float64)
+                return x0, f0
+        raise ValueError(
+            f"At least one point is required to start {self.__class__.__name__}, add data manually or via Xopt.random_evaluate() or Xopt.evaluate_data()"
+        )
@@ -309,6 +309,37 @@ class TestMOBOGenerator:
 
         gen.generate(1)
 
+    def test_last_candidate_initial_conditions(self):
+        test_data = pd.DataFrame(
+            {
+                "x1": [0.1, 0.2, 0.4, 0.4],
+                "x2": [0.1, 0.2, 0.3, 0.2],
+                "y1": [1.0, 2.0, 1.0, 0.0],
+                "y2": [0.5, 0.1, 1.0, 1.5],
+            }
+        )
+        reference_point = {"y1": 10.0, "y2": 1.5}
+        gen = MOBOGenerator(
+            vocs=TEST_VOCS_BASE_MO_NC,
+            reference_point=reference_point,
+            use_last_candidates_as_initial_points=True,
+        )
+        gen.n_monte_carlo_samples = 1
+        gen.numerical_optimizer.max_time = 1.0
+        gen.add_data(test_data)
+
+        # no candidates generated yet -> revert to default behavior
+        assert gen._get_initial_conditions() is None
+
+        gen.generate(1)
+        assert gen._last_candidates is not None
+
+        # the previous candidates are now part of the initial conditions
+        initial_points = gen._get_initial_conditions()
+        assert len(initial_points) == gen.numerical_optimizer.n_restarts
+        assert torch.allclose(initial_points[0], gen._last_candidates)
+        gen.generate(1)
+
     @pytest.mark.parametrize("use_cuda", cuda_combinations)
     def test_log_mobo(self, use_cuda):
         evaluator = Evaluator(function=evaluate_TNK)
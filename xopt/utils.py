@@ -137,21 +137,14 @@ def safe_call(func, *args, **kwargs):
     """
 
     t = time.perf_counter()
-    outputs = {}
     try:
         result = func(*args, **kwargs)
-        outputs["exception"] = None
-        outputs["traceback"] = ""
+        outputs = {"exception": None, "traceback": ""}
     except Exception:
-        exc_tuple = sys.exc_info()
-        error_str = traceback.format_exc()
-        outputs = {}
         result = None
-        outputs["exception"] = exc_tuple
-        outputs["traceback"] = error_str
-    finally:
-        outputs["result"] = result
-        outputs["runtime"] = time.perf_counter() - t
+        outputs = {"exception": sys.exc_info(), "traceback": traceback.format_exc()}
+    outputs["result"] = result
+    outputs["runtime"] = time.perf_counter() - t
     return outputs
 
 
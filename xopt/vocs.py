@@ -405,7 +405,9 @@ class VOCS(XoptBaseModel):
         include_constants : bool, optional
             Whether to include constants in the inputs. Defaults to True.
         seed : int, optional
-            Seed for the random number generator. Defaults to None.
+            Seed for the random number generator. Defaults to None, in which
+            case a fresh, unseeded generator is used -- the global numpy RNG
+            state (``np.random.seed``) does not affect the result.
 
         Returns
         -------
@@ -413,17 +415,15 @@ class VOCS(XoptBaseModel):
             A list of dictionaries containing the sampled inputs.
         """
         inputs = {}
-        if seed is None:
-            rng_sample_function = np.random.random
-        else:
-            rng = np.random.default_rng(seed=seed)
-            rng_sample_function = rng.random
+        # a per-call generator avoids sharing global numpy RNG state between
+        # concurrent runs; passing seed=None draws fresh entropy
+        rng = np.random.default_rng(seed=seed)
 
         bounds = clip_variable_bounds(self, custom_bounds)
 
         for key, val in bounds.items():  # No need to sort here
             a, b = val
-            x = rng_sample_function(n)
+            x = rng.random(n)
             inputs[key] = x * a + (1 - x) * b
 
         # Constants